@@ -725,6 +725,28 @@ simChar* simGetScriptRawBuffer(simInt scriptHandle,simInt bufferHandle);
 simInt simSetScriptRawBuffer(simInt scriptHandle,const simChar* buffer,simInt bufferSize);
 simInt simReleaseScriptRawBuffer(simInt scriptHandle,simInt bufferHandle);
 
+// ==============
+// sim_batch.h
+// ==============
+
+simInt simGetJointPositionsBatch(const simInt* jointHandles,simInt count,simFloat* positions);
+simInt simGetJointTargetPositionsBatch(const simInt* jointHandles,simInt count,simFloat* positions);
+simInt simGetJointTargetVelocitiesBatch(const simInt* jointHandles,simInt count,simFloat* velocities);
+simInt simGetJointForcesBatch(const simInt* jointHandles,simInt count,simFloat* forces);
+simInt simGetJointTypesBatch(const simInt* jointHandles,simInt count,simInt* types);
+simInt simGetJointIntervalsBatch(const simInt* jointHandles,simInt count,simBool* cyclics,simFloat* intervals);
+simInt simGetObjectHandlesBatch(const simChar* const* objectNames,simInt count,simInt* handles);
+simInt simGetObjectTypesBatch(const simInt* objectHandles,simInt count,simInt* types);
+simInt simGetObjectFloatParameterBatch(const simInt* objectHandles,simInt count,simInt parameterID,simFloat* parameters);
+simInt simSetJointPositionsBatch(const simInt* jointHandles,simInt count,const simFloat* positions);
+simInt simSetJointTargetPositionsBatch(const simInt* jointHandles,simInt count,const simFloat* positions);
+simInt simSetJointTargetVelocitiesBatch(const simInt* jointHandles,simInt count,const simFloat* velocities);
+simInt simSetJointMaxForcesBatch(const simInt* jointHandles,simInt count,const simFloat* forces);
+simInt simSetJointIntervalsBatch(const simInt* jointHandles,simInt count,const simBool* cyclics,const simFloat* intervals);
+simInt simSetJointModesBatch(const simInt* jointHandles,simInt count,simInt jointMode,simInt options);
+simInt simSetObjectInt32ParameterBatch(const simInt* objectHandles,simInt count,simInt parameterID,simInt parameter);
+simInt simCopyPasteObjectReturnSuffix(simInt objectHandle,simInt options,simInt* suffix);
+
 """)
 
 cwd = os.getcwd()
@@ -734,6 +756,7 @@ ffibuilder.set_source(
     "pyrep.backend._sim_cffi",
     """
          #include "sim.h"   // the C header of the library
+         #include "sim_batch.h"   // batched helpers over the library
     """,
     libraries=['coppeliaSim'],
     library_dirs=[os.environ['COPPELIASIM_ROOT']],
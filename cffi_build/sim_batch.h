@@ -0,0 +1,227 @@
+// ==============
+// sim_batch.h
+// ==============
+
+// Batched (and fused) versions of library calls, compiled into the cffi
+// module. Each batched helper loops over `count` object handles in C, so
+// that querying a whole joint group costs a single Python -> C crossing.
+//
+// The position, target position and target velocity getters, like all the
+// setters, are applied to every handle, and return the value of the first
+// call that failed (<= 0), otherwise 1. Their per-joint wrappers never
+// checked for errors, so the joints after a failing one must still be read.
+// The other getters stop at the first failing call and return its value,
+// otherwise they return 1. Failure is <= 0 for simGetJointForce and
+// simGetObjectFloatParameter (0 means no value), and < 0 for the rest.
+//
+// Must be included after sim.h.
+
+static simInt simGetJointPositionsBatch(const simInt* jointHandles,simInt count,simFloat* positions)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simGetJointPosition(jointHandles[i], positions + i);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+static simInt simGetJointTargetPositionsBatch(const simInt* jointHandles,simInt count,simFloat* positions)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simGetJointTargetPosition(jointHandles[i], positions + i);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+static simInt simGetJointTargetVelocitiesBatch(const simInt* jointHandles,simInt count,simFloat* velocities)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simGetJointTargetVelocity(jointHandles[i], velocities + i);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+static simInt simGetJointForcesBatch(const simInt* jointHandles,simInt count,simFloat* forces)
+{
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simGetJointForce(jointHandles[i], forces + i);
+        if (ret <= 0)
+            return ret;
+    }
+    return 1;
+}
+
+static simInt simGetJointTypesBatch(const simInt* jointHandles,simInt count,simInt* types)
+{
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simGetJointType(jointHandles[i]);
+        if (ret < 0)
+            return ret;
+        types[i] = ret;
+    }
+    return 1;
+}
+
+// intervals receives 2 values (minimum, range) per joint.
+static simInt simGetJointIntervalsBatch(const simInt* jointHandles,simInt count,simBool* cyclics,simFloat* intervals)
+{
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simGetJointInterval(jointHandles[i], cyclics + i, intervals + 2 * i);
+        if (ret < 0)
+            return ret;
+    }
+    return 1;
+}
+
+// The failing name, if any, is the one whose handle is left at -1.
+static simInt simGetObjectHandlesBatch(const simChar* const* objectNames,simInt count,simInt* handles)
+{
+    for (simInt i = 0; i < count; i++)
+    {
+        handles[i] = simGetObjectHandle(objectNames[i]);
+        if (handles[i] < 0)
+            return handles[i];
+    }
+    return 1;
+}
+
+static simInt simGetObjectTypesBatch(const simInt* objectHandles,simInt count,simInt* types)
+{
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simGetObjectType(objectHandles[i]);
+        if (ret < 0)
+            return ret;
+        types[i] = ret;
+    }
+    return 1;
+}
+
+static simInt simGetObjectFloatParameterBatch(const simInt* objectHandles,simInt count,simInt parameterID,simFloat* parameters)
+{
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simGetObjectFloatParameter(objectHandles[i], parameterID, parameters + i);
+        if (ret <= 0)
+            return ret;
+    }
+    return 1;
+}
+
+static simInt simSetJointPositionsBatch(const simInt* jointHandles,simInt count,const simFloat* positions)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simSetJointPosition(jointHandles[i], positions[i]);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+static simInt simSetJointTargetPositionsBatch(const simInt* jointHandles,simInt count,const simFloat* positions)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simSetJointTargetPosition(jointHandles[i], positions[i]);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+static simInt simSetJointTargetVelocitiesBatch(const simInt* jointHandles,simInt count,const simFloat* velocities)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simSetJointTargetVelocity(jointHandles[i], velocities[i]);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+static simInt simSetJointMaxForcesBatch(const simInt* jointHandles,simInt count,const simFloat* forces)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simSetJointMaxForce(jointHandles[i], forces[i]);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+// intervals holds 2 values (minimum, range) per joint.
+static simInt simSetJointIntervalsBatch(const simInt* jointHandles,simInt count,const simBool* cyclics,const simFloat* intervals)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simSetJointInterval(jointHandles[i], cyclics[i], intervals + 2 * i);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+static simInt simSetJointModesBatch(const simInt* jointHandles,simInt count,simInt jointMode,simInt options)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simSetJointMode(jointHandles[i], jointMode, options);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+static simInt simSetObjectInt32ParameterBatch(const simInt* objectHandles,simInt count,simInt parameterID,simInt parameter)
+{
+    simInt result = 1;
+    for (simInt i = 0; i < count; i++)
+    {
+        simInt ret = simSetObjectInt32Parameter(objectHandles[i], parameterID, parameter);
+        if (ret <= 0 && result > 0)
+            result = ret;
+    }
+    return result;
+}
+
+// Copy-pastes a single object (or model) and reports the name suffix of
+// the pasted copy (-1 if it has none), saving the name round-trip through
+// Python. Returns the handle of the copy, or the failing return value.
+static simInt simCopyPasteObjectReturnSuffix(simInt objectHandle,simInt options,simInt* suffix)
+{
+    simInt handles[1] = {objectHandle};
+    simInt ret = simCopyPasteObjects(handles, 1, options);
+    if (ret < 0)
+        return ret;
+    *suffix = -1;
+    simChar* name = simGetObjectName(handles[0]);
+    if (name != NULL)
+    {
+        *suffix = simGetNameSuffix(name);
+        simReleaseBuffer(name);
+    }
+    return handles[0];
+}
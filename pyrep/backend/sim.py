@@ -42,6 +42,32 @@ def _check_set_object_parameter(ret):
             'correct type)')
 
 
+def _as_handle_array(handles):
+    # Handle arrays cached as int32 numpy arrays are passed without a copy,
+    # any other numpy array is converted to int32 first.
+    if isinstance(handles, np.ndarray):
+        return ffi.from_buffer(
+            'int[]', np.ascontiguousarray(handles, dtype=np.int32))
+    return handles
+
+
+def _check_batch_len(values, count):
+    if len(values) != count:
+        raise RuntimeError(
+            'Expected %d values, but got %d.' % (count, len(values)))
+
+
+def _as_float_array(values, count):
+    # 1D numpy arrays are handed over as a buffer, rather than being boxed
+    # into Python floats one element at a time.
+    if isinstance(values, np.ndarray) and values.shape == (count,):
+        return ffi.from_buffer(
+            'float[]', np.ascontiguousarray(values, dtype=np.float32))
+    values = list(values)
+    _check_batch_len(values, count)
+    return ffi.new('float[%d]' % count, values)
+
+
 def simExtLaunchUIThread(options, scene, pyrep_root):
     lib.simExtLaunchUIThread(
         'PyRep'.encode('ascii'), options, scene.encode('ascii'),
@@ -208,6 +234,150 @@ def simSetJointInterval(jointHandle, cyclic, interval):
     _check_return(ret)
 
 
+def simGetJointPositionsBatch(jointHandles):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    positions = ffi.new('float[%d]' % count)
+    lib.simGetJointPositionsBatch(jointHandles, count, positions)
+    return list(positions)
+
+
+def simGetJointTargetPositionsBatch(jointHandles):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    positions = ffi.new('float[%d]' % count)
+    lib.simGetJointTargetPositionsBatch(jointHandles, count, positions)
+    return list(positions)
+
+
+def simGetJointTargetVelocitiesBatch(jointHandles):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    velocities = ffi.new('float[%d]' % count)
+    lib.simGetJointTargetVelocitiesBatch(jointHandles, count, velocities)
+    return list(velocities)
+
+
+def simGetJointForcesBatch(jointHandles):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    forces = ffi.new('float[%d]' % count)
+    ret = lib.simGetJointForcesBatch(jointHandles, count, forces)
+    _check_return(ret)
+    if ret == 0:
+        raise RuntimeError('No value available yet.')
+    return list(forces)
+
+
+def simGetJointTypesBatch(jointHandles):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    types = ffi.new('int[%d]' % count)
+    ret = lib.simGetJointTypesBatch(jointHandles, count, types)
+    _check_return(ret)
+    return list(types)
+
+
+def simGetJointIntervalsBatch(jointHandles):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    cyclics = ffi.new('simBool[%d]' % count)
+    intervals = ffi.new('float[%d]' % (2 * count))
+    ret = lib.simGetJointIntervalsBatch(jointHandles, count, cyclics, intervals)
+    _check_return(ret)
+    cyclics = np.frombuffer(ffi.buffer(cyclics), dtype=np.uint8)
+    intervals = np.frombuffer(ffi.buffer(intervals), dtype=np.float32)
+    return cyclics.astype(bool).tolist(), intervals.reshape(count, 2).tolist()
+
+
+def simGetObjectHandlesBatch(objectNames):
+    count = len(objectNames)
+    names = [ffi.new('char[]', n.encode('ascii')) for n in objectNames]
+    handles = ffi.new('int[%d]' % count)
+    ret = lib.simGetObjectHandlesBatch(names, count, handles)
+    if ret < 0:
+        name = objectNames[list(handles).index(ret)]
+        raise RuntimeError('Handle %s does not exist.' % name)
+    return list(handles)
+
+
+def simGetObjectTypesBatch(objectHandles):
+    objectHandles = _as_handle_array(objectHandles)
+    count = len(objectHandles)
+    types = ffi.new('int[%d]' % count)
+    ret = lib.simGetObjectTypesBatch(objectHandles, count, types)
+    _check_return(ret)
+    return list(types)
+
+
+def simGetObjectFloatParameterBatch(objectHandles, parameter):
+    objectHandles = _as_handle_array(objectHandles)
+    count = len(objectHandles)
+    values = ffi.new('float[%d]' % count)
+    ret = lib.simGetObjectFloatParameterBatch(
+        objectHandles, count, parameter, values)
+    _check_set_object_parameter(ret)
+    _check_return(ret)
+    return list(values)
+
+
+def simSetJointPositionsBatch(jointHandles, positions):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    positions = _as_float_array(positions, count)
+    lib.simSetJointPositionsBatch(jointHandles, count, positions)
+
+
+def simSetJointTargetPositionsBatch(jointHandles, targetPositions):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    positions = _as_float_array(targetPositions, count)
+    lib.simSetJointTargetPositionsBatch(jointHandles, count, positions)
+
+
+def simSetJointTargetVelocitiesBatch(jointHandles, targetVelocities):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    velocities = _as_float_array(targetVelocities, count)
+    lib.simSetJointTargetVelocitiesBatch(jointHandles, count, velocities)
+
+
+def simSetJointMaxForcesBatch(jointHandles, forces):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    forces = _as_float_array(forces, count)
+    lib.simSetJointMaxForcesBatch(jointHandles, count, forces)
+
+
+def simSetJointIntervalsBatch(jointHandles, cyclics, intervals):
+    jointHandles = _as_handle_array(jointHandles)
+    count = len(jointHandles)
+    cyclics = [bool(c) for c in cyclics]
+    _check_batch_len(cyclics, count)
+    flat_intervals = [v for interval in intervals for v in interval]
+    _check_batch_len(flat_intervals, 2 * count)
+    cyclics = ffi.new('simBool[%d]' % count, cyclics)
+    intervals = ffi.new('float[%d]' % (2 * count), flat_intervals)
+    ret = lib.simSetJointIntervalsBatch(jointHandles, count, cyclics, intervals)
+    _check_return(ret)
+
+
+def simSetJointModesBatch(jointHandles, mode):
+    jointHandles = _as_handle_array(jointHandles)
+    options = 0
+    ret = lib.simSetJointModesBatch(
+        jointHandles, len(jointHandles), mode, options)
+    _check_return(ret)
+
+
+def simSetObjectInt32ParameterBatch(objectHandles, parameter, value):
+    objectHandles = _as_handle_array(objectHandles)
+    ret = lib.simSetObjectInt32ParameterBatch(
+        objectHandles, len(objectHandles), parameter, value)
+    _check_set_object_parameter(ret)
+    _check_return(ret)
+
+
 def simCreateForceSensor(options, intParams, floatParams, color):
     if color is None:
         color = ffi.NULL
@@ -707,7 +877,8 @@ def simExtCallScriptFunction(functionNameAtScriptName, scriptHandleOrType,
 
     simReleaseBuffer(ffi.cast('char *', outInt[0]))
     simReleaseBuffer(ffi.cast('char *', outFloat[0]))
-    [simReleaseBuffer(outString[0][i]) for i in range(outStringCnt[0])]
+    for i in range(outStringCnt[0]):
+        simReleaseBuffer(outString[0][i])
     simReleaseBuffer(outBuffer[0])
 
     return ret_ints, ret_floats, ret_strings, ret_buffer
@@ -1128,6 +1299,13 @@ def simCopyPasteObjects(objectHandles, options):
     return list(handles)
 
 
+def simCopyPasteObjectReturnSuffix(objectHandle, options):
+    suffix = ffi.new('int *')
+    handle = lib.simCopyPasteObjectReturnSuffix(objectHandle, options, suffix)
+    _check_return(handle)
+    return handle, suffix[0]
+
+
 def simHandleIkGroup(ikGroupHandle):
     ret = lib.simHandleIkGroup(ikGroupHandle)
     _check_return(ret)
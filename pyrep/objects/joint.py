@@ -15,6 +15,26 @@ class Joint(Object):
     def __init__(self, name_or_handle: Union[str, int]):
         super().__init__(name_or_handle)
 
+    @classmethod
+    def _from_names(cls, names: List[str]) -> List['Joint']:
+        """Gets several joints at once.
+
+        Equivalent to ``[Joint(name) for name in names]``, but all the handles
+        and types are looked up with one batched call each.
+
+        :param names: The names of the joints.
+        :return: A list of joints, in the same order as the names.
+        """
+        handles = sim.simGetObjectHandlesBatch(names)
+        types = sim.simGetObjectTypesBatch(handles)
+        joints = []
+        for handle, object_type in zip(handles, types):
+            joint = cls.__new__(cls)
+            joint._handle = handle
+            joint._assert_type(ObjectType(object_type))
+            joints.append(joint)
+        return joints
+
     def _get_requested_type(self) -> ObjectType:
         return ObjectType.JOINT
 
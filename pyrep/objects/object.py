@@ -22,12 +22,7 @@ class Object(object):
             self._handle = name_or_handle
         else:
             self._handle = sim.simGetObjectHandle(name_or_handle)
-        assert_type = self._get_requested_type()
-        actual = ObjectType(sim.simGetObjectType(self._handle))
-        if actual != assert_type:
-            raise WrongObjectTypeError(
-                'You requested object of type %s, but the actual type was '
-                '%s' % (assert_type.name, actual.name))
+        self._assert_type(ObjectType(sim.simGetObjectType(self._handle)))
 
     def __eq__(self, other: object):
         if not isinstance(other, Object):
@@ -87,6 +82,13 @@ class Object(object):
         """
         raise NotImplementedError('Must be overridden.')
 
+    def _assert_type(self, actual: ObjectType) -> None:
+        assert_type = self._get_requested_type()
+        if actual != assert_type:
+            raise WrongObjectTypeError(
+                'You requested object of type %s, but the actual type was '
+                '%s' % (assert_type.name, actual.name))
+
     def get_type(self) -> ObjectType:
         """Gets the type of the object.
 
@@ -186,7 +186,8 @@ class PyRep(object):
             sim.simStopSimulation()
             self.running = False
             # Need this so the UI updates
-            [self.step() for _ in range(5)]  # type: ignore
+            for _ in range(5):
+                self.step()
 
     def step(self) -> None:
         """Execute the next simulation step.
@@ -295,15 +296,8 @@ class PyRep(object):
         :param repeat_along_v: Texture will be repeated along the V direction.
         :return: A tuple containing the textured plane and the texture.
         """
-        options = 0
-        if not interpolate:
-            options |= 1
-        if decal_mode:
-            options |= 2
-        if repeat_along_u:
-            options |= 3
-        if repeat_along_v:
-            options |= 4
+        options = (int(not interpolate) | int(decal_mode) << 1 |
+                   int(repeat_along_u) << 2 | int(repeat_along_v) << 3)
         handle = sim.simCreateTexture(filename, options)
         s = Shape(handle)
         return s, s.get_texture()
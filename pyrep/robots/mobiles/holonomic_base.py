@@ -197,7 +197,8 @@ class HolonomicBase(MobileBase):
     def _reset_wheel(self):
         """Required to achieve desired omnidirectional wheel effect.
         """
-        [j.reset_dynamic_object() for j in self.wheels]
+        for j in self.wheels:
+            j.reset_dynamic_object()
 
         p = [[-pi / 4, 0, 0], [pi / 4, 0, pi], [-pi / 4, 0, 0], [pi / 4, 0, pi]]
 
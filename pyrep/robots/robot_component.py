@@ -1,4 +1,6 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
 
 from pyrep.objects.shape import Shape
 
@@ -21,9 +23,14 @@ class RobotComponent(Object):
         self._num_joints = len(joint_names)
 
         # Joint handles
-        self.joints = [Joint(jname + suffix)
-                       for jname in joint_names]
-        self._joint_handles = [j.get_handle() for j in self.joints]
+        self.joints = Joint._from_names(
+            [jname + suffix for jname in joint_names])
+        # Cached once, in handle-array form, for the batched joint calls.
+        self._joint_handles = np.fromiter(
+            (j.get_handle() for j in self.joints), dtype=np.int32,
+            count=self._num_joints)
+        self._joint_handles.flags.writeable = False
+        self._visuals: Optional[List[Object]] = None
 
     def copy(self) -> 'RobotComponent':
         """Copy and pastes the arm in the scene.
@@ -33,15 +40,10 @@ class RobotComponent(Object):
 
         :return: The new pasted arm.
         """
-        # Copy whole model
-        handle = sim.simCopyPasteObjects([self._handle], 1)[0]
-        name = sim.simGetObjectName(handle)
-        # Find the number of this arm
-        num = name[name.rfind('#') + 1:]
-        if len(num) > 0:
-            num = int(num) + 1
-        else:
-            num = 0
+        # Copy whole model, and find the number of this arm from the name
+        # suffix of the copy
+        _, suffix = sim.simCopyPasteObjectReturnSuffix(self._handle, 1)
+        num = suffix + 1 if suffix >= 0 else 0
         # FIXME: Pass valid name and joint_names.
         return self.__class__(num)  # type: ignore
 
@@ -64,7 +66,8 @@ class RobotComponent(Object):
 
         :return: A list containing the types of the joints.
         """
-        return [j.get_joint_type() for j in self.joints]
+        return [JointType(t)
+                for t in sim.simGetJointTypesBatch(self._joint_handles)]
 
     def get_joint_positions(self) -> List[float]:
         """Retrieves the intrinsic position of the joints.
@@ -73,10 +76,11 @@ class RobotComponent(Object):
 
         :return: A list of intrinsic position of the joints.
         """
-        return [j.get_joint_position() for j in self.joints]
+        return sim.simGetJointPositionsBatch(self._joint_handles)
 
-    def set_joint_positions(self, positions: List[float],
-                            disable_dynamics: bool = False) -> None:
+    def set_joint_positions(self, positions: Union[List[float], np.ndarray],
+                            disable_dynamics: bool = False,
+                            step: bool = True) -> None:
         """Sets the intrinsic position of the joints.
 
         See :py:meth:`Joint.set_joint_position` for more information.
@@ -86,35 +90,44 @@ class RobotComponent(Object):
             move the joint, and then re-enable dynamics.
 
         :param positions: A list of positions of the joints (angular or linear
-            values depending on the joint type).
+            values depending on the joint type). A 1D numpy array with one
+            value per joint is passed to the simulator as a buffer. It is cast
+            to float32 (the simulator's simFloat), so float32 arrays avoid a
+            copy.
+        :param step: Only used when disable_dynamics is True. If False, the
+            simulation step that normally follows re-enabling the dynamics is
+            skipped, and the change takes effect on the caller's next step
+            instead. Useful when resetting several components at once.
         """
         self._assert_len(positions)
+        joint_handles = self._joint_handles
         if not disable_dynamics:
-            [sim.simSetJointPosition(jh, p)  # type: ignore
-             for jh, p in zip(self._joint_handles, positions)]
+            sim.simSetJointPositionsBatch(joint_handles, positions)
             return
 
+        handle = self._handle
         is_model = self.is_model()
         if not is_model:
             self.set_model(True)
 
-        prior = sim.simGetModelProperty(self.get_handle())
+        prior = sim.simGetModelProperty(handle)
         p = prior | sim.sim_modelproperty_not_dynamic
         # Disable the dynamics
-        sim.simSetModelProperty(self._handle, p)
+        sim.simSetModelProperty(handle, p)
         with utils.step_lock:
             sim.simExtStep(True)  # Have to step for changes to take effect
 
-        [sim.simSetJointPosition(jh, p)  # type: ignore
-         for jh, p in zip(self._joint_handles, positions)]
-        [j.set_joint_target_position(p)  # type: ignore
-         for j, p in zip(self.joints, positions)]
+        # Converted once, as it is sent both as positions and targets
+        positions = np.asarray(positions, dtype=np.float32)
+        sim.simSetJointPositionsBatch(joint_handles, positions)
+        sim.simSetJointTargetPositionsBatch(joint_handles, positions)
 
         # Re-enable the dynamics
-        sim.simSetModelProperty(self._handle, prior)
+        sim.simSetModelProperty(handle, prior)
         self.set_model(is_model)
-        with utils.step_lock:
-            sim.simExtStep(True)  # Have to step for changes to take effect
+        if step:
+            with utils.step_lock:
+                sim.simExtStep(True)  # Have to step for changes to take effect
 
     def get_joint_target_positions(self) -> List[float]:
         """Retrieves the target positions of the joints.
@@ -122,19 +135,22 @@ class RobotComponent(Object):
         :return: A list of target position of the joints (angular or linear
             values depending on the joint type).
         """
-        return [j.get_joint_target_position() for j in self.joints]
+        return sim.simGetJointTargetPositionsBatch(self._joint_handles)
 
-    def set_joint_target_positions(self, positions: List[float]) -> None:
+    def set_joint_target_positions(
+            self, positions: Union[List[float], np.ndarray]) -> None:
         """Sets the target positions of the joints.
 
         See :py:meth:`Joint.set_joint_target_position` for more information.
 
         :param positions: List of target position of the joints (angular or
-            linear values depending on the joint type).
+            linear values depending on the joint type). A 1D numpy array with
+            one value per joint is passed to the simulator as a buffer, which
+            is the fastest option in control loops. It is cast to float32 (the
+            simulator's simFloat), so float32 arrays avoid a copy.
         """
         self._assert_len(positions)
-        [j.set_joint_target_position(p)  # type: ignore
-         for j, p in zip(self.joints, positions)]
+        sim.simSetJointTargetPositionsBatch(self._joint_handles, positions)
 
     def get_joint_target_velocities(self) -> List[float]:
         """Retrieves the intrinsic target velocities of the joints.
@@ -142,18 +158,20 @@ class RobotComponent(Object):
          :return: List of the target velocity of the joints (linear or angular
             velocity depending on the joint-type).
          """
-        return [j.get_joint_target_velocity()  # type: ignore
-                for j in self.joints]
+        return sim.simGetJointTargetVelocitiesBatch(self._joint_handles)
 
-    def set_joint_target_velocities(self, velocities: List[float]) -> None:
+    def set_joint_target_velocities(
+            self, velocities: Union[List[float], np.ndarray]) -> None:
         """Sets the intrinsic target velocities of the joints.
 
         :param velocities: List of the target velocity of the joints (linear
-            or angular velocities depending on the joint-type).
+            or angular velocities depending on the joint-type). A 1D numpy
+            array with one value per joint is passed to the simulator as a
+            buffer. It is cast to float32 (the simulator's simFloat), so
+            float32 arrays avoid a copy.
         """
         self._assert_len(velocities)
-        [j.set_joint_target_velocity(v)  # type: ignore
-         for j, v in zip(self.joints, velocities)]
+        sim.simSetJointTargetVelocitiesBatch(self._joint_handles, velocities)
 
     def get_joint_forces(self) -> List[float]:
         """Retrieves the forces or torques of the joints.
@@ -163,19 +181,21 @@ class RobotComponent(Object):
         :return: A list of the forces or the torques applied to the joints
             along/about their z-axis.
         """
-        return [j.get_joint_force() for j in self.joints]
+        return sim.simGetJointForcesBatch(self._joint_handles)
 
-    def set_joint_forces(self, forces: List[float]) -> None:
+    def set_joint_forces(
+            self, forces: Union[List[float], np.ndarray]) -> None:
         """Sets the maximum force or torque that the joints can exert.
 
         See :py:meth:`Joint.set_joint_force` for more information.
 
         :param forces: The maximum force or torque that the joints can exert.
-            These cannot be negative values.
+            These cannot be negative values. A 1D numpy array with one value
+            per joint is passed to the simulator as a buffer. It is cast to
+            float32 (the simulator's simFloat), so float32 arrays avoid a copy.
         """
         self._assert_len(forces)
-        [j.set_joint_force(f)  # type: ignore
-         for j, f in zip(self.joints, forces)]
+        sim.simSetJointMaxForcesBatch(self._joint_handles, forces)
 
     def get_joint_velocities(self) -> List[float]:
         """Get the current joint velocities.
@@ -183,7 +203,8 @@ class RobotComponent(Object):
         :return: List containing the velocities of the joints (linear or
             angular velocities depending on the joint-type).
         """
-        return [j.get_joint_velocity() for j in self.joints]
+        return sim.simGetObjectFloatParameterBatch(
+            self._joint_handles, sim.sim_jointfloatparam_velocity)
 
     def get_joint_intervals(self) -> Tuple[List[bool], List[List[float]]]:
         """Retrieves the interval parameters of the joints.
@@ -194,12 +215,7 @@ class RobotComponent(Object):
             is cyclic (the joint varies between -pi and +pi in a cyclic manner),
             and a 2D list containing the interval of the joints.
         """
-        cyclics, intervals = [], []
-        for j in self.joints:
-            c, i = j.get_joint_interval()
-            cyclics.append(c)
-            intervals.append(i)
-        return cyclics, intervals
+        return sim.simGetJointIntervalsBatch(self._joint_handles)
 
     def set_joint_intervals(self, cyclic: List[bool],
                             intervals: List[List[float]]) -> None:
@@ -213,23 +229,23 @@ class RobotComponent(Object):
         """
         self._assert_len(cyclic)
         self._assert_len(intervals)
-        [j.set_joint_interval(c, i)  # type: ignore
-         for j, c, i in zip( self.joints, cyclic, intervals)]
+        sim.simSetJointIntervalsBatch(self._joint_handles, cyclic, intervals)
 
     def get_joint_upper_velocity_limits(self) -> List[float]:
         """Gets upper velocity limits of the joints.
 
          :return: List of the upper velocity limits.
          """
-        return [j.get_joint_upper_velocity_limit() for j in self.joints]
+        return sim.simGetObjectFloatParameterBatch(
+            self._joint_handles, sim.sim_jointfloatparam_upper_limit)
 
     def set_control_loop_enabled(self, value: bool) -> None:
         """Sets whether the control loop is enable for all joints.
 
         :param value: The new value for the control loop state.
         """
-        [j.set_control_loop_enabled(value)  # type: ignore
-         for j in self.joints]
+        sim.simSetObjectInt32ParameterBatch(
+            self._joint_handles, sim.sim_jointintparam_ctrl_enabled, value)
 
     def set_motor_locked_at_zero_velocity(self, value: bool) -> None:
         """Sets if motor is locked when target velocity is zero for all joints.
@@ -239,16 +255,15 @@ class RobotComponent(Object):
 
         :param value: If the motors should be locked at zero velocity.
         """
-        [j.set_motor_locked_at_zero_velocity(value)  # type: ignore
-         for j in self.joints]
+        sim.simSetObjectInt32ParameterBatch(
+            self._joint_handles, sim.sim_jointintparam_velocity_lock, value)
 
     def set_joint_mode(self, value: JointMode) -> None:
         """Sets the operation mode of the joint group.
 
         :param value: The new joint mode value.
         """
-        [j.set_joint_mode(value)  # type: ignore
-         for j in self.joints]
+        sim.simSetJointModesBatch(self._joint_handles, value.value)
 
     def get_joint_modes(self) -> List[JointMode]:
         """Gets the operation mode of the joint group.
@@ -263,13 +278,25 @@ class RobotComponent(Object):
         Can be useful for methods such as domain randomization.
         Should ideally be overridden for each robot.
 
+        The result is cached after the first call, as the component's tree
+        rarely changes. Call :py:meth:`invalidate_visuals_cache` after adding
+        or removing visual shapes.
+
         :return: A list of visual shapes.
         """
-        tree = self.get_objects_in_tree(ObjectType.SHAPE, exclude_base=False)
-        return [obj for obj in tree if 'visual' in obj.get_name()]
+        if self._visuals is None:
+            tree = self.get_objects_in_tree(
+                ObjectType.SHAPE, exclude_base=False)
+            self._visuals = [obj for obj in tree if 'visual' in obj.get_name()]
+        return list(self._visuals)
+
+    def invalidate_visuals_cache(self) -> None:
+        """Forces the next :py:meth:`get_visuals` call to search the tree.
+        """
+        self._visuals = None
 
-    def _assert_len(self, inputs: list) -> None:
-        if len(self.joints) != len(inputs):
+    def _assert_len(self, inputs: Union[list, np.ndarray]) -> None:
+        if self._num_joints != len(inputs):
             raise RuntimeError(
                 'Tried to set values for %d joints, but joint group consists '
-                'of %d joints.' % (len(inputs), len(self.joints)))
+                'of %d joints.' % (len(inputs), self._num_joints))
@@ -1,7 +1,9 @@
 import unittest
+from unittest import mock
 from tests.core import TestCore
 from pyrep.const import JointType
 from pyrep.robots.arms.panda import Panda
+from pyrep.robots.robot_component import RobotComponent
 import numpy as np
 
 
@@ -22,11 +24,24 @@ class TestJointGroups(TestCore):
         self.robot.set_joint_positions([0.1] * self.num_joints)
         self.assertEqual(len(self.robot.get_joint_positions()), self.num_joints)
 
+    def test_set_joint_positions_deferred_step(self):
+        self.robot.set_joint_positions(
+            [0.1] * self.num_joints, disable_dynamics=True, step=False)
+        self.pyrep.step()
+        self.assertTrue(np.allclose(
+            self.robot.get_joint_positions(), [0.1] * self.num_joints,
+            atol=1e-2))
+
     def test_get_set_joint_target_positions(self):
         self.robot.set_joint_target_positions([0.1] * self.num_joints)
         self.assertEqual(
             len(self.robot.get_joint_target_positions()), self.num_joints)
 
+    def test_set_joint_target_positions_from_array(self):
+        self.robot.set_joint_target_positions(np.full(self.num_joints, 0.1))
+        self.assertTrue(np.allclose(
+            self.robot.get_joint_target_positions(), 0.1))
+
     def test_get_set_joint_target_velocities(self):
         self.robot.set_joint_target_velocities([0.1] * self.num_joints)
         self.assertEqual(
@@ -56,6 +71,18 @@ class TestJointGroups(TestCore):
     def test_get_visuals(self):
         self.assertEqual(len(self.robot.get_visuals()), 10)
 
+    def test_get_visuals_cached(self):
+        get_objects_in_tree = RobotComponent.get_objects_in_tree
+        with mock.patch.object(
+                RobotComponent, 'get_objects_in_tree', autospec=True,
+                side_effect=get_objects_in_tree) as tree_mock:
+            visuals = self.robot.get_visuals()
+            self.assertEqual(self.robot.get_visuals(), visuals)
+            self.assertEqual(tree_mock.call_count, 1)
+            self.robot.invalidate_visuals_cache()
+            self.assertEqual(self.robot.get_visuals(), visuals)
+            self.assertEqual(tree_mock.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
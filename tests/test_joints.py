@@ -12,6 +12,14 @@ class TestJoints(TestCore):
         self.prismatic_ctr = Joint('prismatic_joint_control_loop')
         self.revolute = Joint('revolute_joint')
 
+    def test_from_names(self):
+        joints = Joint._from_names(['prismatic_joint', 'revolute_joint'])
+        self.assertEqual(joints, [self.prismatic, self.revolute])
+
+    def test_from_names_missing(self):
+        with self.assertRaises(RuntimeError):
+            Joint._from_names(['prismatic_joint', 'no_such_joint'])
+
     def test_get_joint_type(self):
         self.assertEqual(self.prismatic.get_joint_type(), JointType.PRISMATIC)
 
@@ -29,7 +37,8 @@ class TestJoints(TestCore):
         pos = self.prismatic_ctr.get_joint_target_position()
         self.assertEqual(pos, 0.5)
         # Now step a few times to drive the joint
-        [self.pyrep.step() for _ in range(10)]
+        for _ in range(10):
+            self.pyrep.step()
         self.assertAlmostEqual(
             self.prismatic_ctr.get_joint_position(), 0.5, delta=0.01)
 
@@ -38,12 +47,14 @@ class TestJoints(TestCore):
         vel = self.prismatic.get_joint_target_velocity()
         self.assertEqual(vel, 5.0)
         # Now step a few times to drive the joint
-        [self.pyrep.step() for _ in range(10)]
+        for _ in range(10):
+            self.pyrep.step()
         self.assertAlmostEqual(
             self.prismatic.get_joint_position(), 0.5, delta=0.01)
 
     def test_get_set_joint_force(self):
-        [self.pyrep.step() for _ in range(10)]
+        for _ in range(10):
+            self.pyrep.step()
         # Set a really high velocity (torque control)
         self.prismatic.set_joint_target_velocity(-99999)
         self.prismatic.set_joint_force(0.6)
@@ -1,5 +1,6 @@
 import unittest
 import warnings
+from unittest import mock
 import tempfile
 from tests.core import TestCore
 from tests.core import ASSET_DIR
@@ -11,6 +12,7 @@ from pyrep.objects.proximity_sensor import ProximitySensor
 from pyrep.objects.force_sensor import ForceSensor
 from pyrep.objects.cartesian_path import CartesianPath
 from pyrep.errors import WrongObjectTypeError
+from pyrep.backend import sim
 import os
 from os import path
 import numpy as np
@@ -45,7 +47,8 @@ class TestPyrep(TestCore):
     def test_step(self):
         cube = Shape('dynamic_cube')
         start_pos = cube.get_position()
-        [self.pyrep.step() for _ in range(2)]
+        for _ in range(2):
+            self.pyrep.step()
         end_pos = cube.get_position()
         self.assertFalse(np.allclose(start_pos, end_pos))
 
@@ -83,7 +86,8 @@ class TestPyrep(TestCore):
         pos = dynamic_cube.get_position()
         config = dynamic_cube.get_configuration_tree()
         self.assertIsNotNone(config)
-        [self.pyrep.step() for _ in range(10)]
+        for _ in range(10):
+            self.pyrep.step()
         self.pyrep.set_configuration_tree(config)
         self.assertTrue(np.allclose(pos, dynamic_cube.get_position()))
 
@@ -94,6 +98,24 @@ class TestPyrep(TestCore):
         self.assertEqual(texture.get_texture_id(),
                          plane.get_texture().get_texture_id())
 
+    def test_create_texture_options(self):
+        texture_file = path.join(ASSET_DIR, 'wood_texture.jpg')
+        flag_to_option = [
+            ({}, 0),
+            ({'interpolate': False}, 1),
+            ({'decal_mode': True}, 2),
+            ({'repeat_along_u': True}, 4),
+            ({'repeat_along_v': True}, 8),
+            ({'interpolate': False, 'decal_mode': True,
+              'repeat_along_u': True, 'repeat_along_v': True}, 15),
+        ]
+        for flags, options in flag_to_option:
+            with self.subTest(flags=flags), mock.patch.object(
+                    sim, 'simCreateTexture',
+                    wraps=sim.simCreateTexture) as create_mock:
+                self.pyrep.create_texture(texture_file, **flags)
+                create_mock.assert_called_once_with(texture_file, options)
+
     def test_get_objects_in_tree(self):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter('always')
@@ -8,7 +8,8 @@ class TestSphericalVisionSensors(TestCore):
 
     def setUp(self):
         super().setUp()
-        [self.pyrep.step() for _ in range(10)]
+        for _ in range(10):
+            self.pyrep.step()
         self.spherical_vision_sensor = SphericalVisionSensor('sphericalVisionRGBAndDepth')
 
     def test_handle_explicitly(self):
@@ -8,7 +8,8 @@ class TestVisionSensors(TestCore):
 
     def setUp(self):
         super().setUp()
-        [self.pyrep.step() for _ in range(10)]
+        for _ in range(10):
+            self.pyrep.step()
         self.cam = VisionSensor('cam0')
 
     def test_handle_explicitly(self):